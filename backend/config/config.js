@@ -14,11 +14,14 @@ module.exports = {
     port: process.env.DB_PORT || 5432,
     dialect: 'postgres',
     logging: process.env.NODE_ENV === 'development' ? console.log : false,
+    // Connection pool: auth-heavy endpoints pay a full TCP+TLS+startup
+    // handshake whenever the pool is exhausted or cold, so keep a couple
+    // of warm connections and allow more concurrency than the old max of 5
     pool: {
-      max: 5,
-      min: 0,
-      acquire: 30000,
-      idle: 10000
+      max: parseInt(process.env.DB_POOL_MAX) || 20,
+      min: parseInt(process.env.DB_POOL_MIN) || 2,
+      acquire: parseInt(process.env.DB_POOL_ACQUIRE_MS) || 30000,
+      idle: parseInt(process.env.DB_POOL_IDLE_MS) || 10000
     },
     ssl: process.env.NODE_ENV === 'production',
   },
@@ -9,14 +9,15 @@ const sequelize = process.env.DATABASE_URL
       dialect: 'postgres',
       logging: config.database.logging,
       pool: config.database.pool,
-      ...(isProduction && {
-        dialectOptions: {
+      dialectOptions: {
+        keepAlive: true,
+        ...(isProduction && {
           ssl: {
             require: true,
             rejectUnauthorized: false,
           },
-        },
-      }),
+        }),
+      },
       define: {
         schema: 'public',
         timestamps: true,
@@ -34,14 +35,15 @@ const sequelize = process.env.DATABASE_URL
         dialect: config.database.dialect,
         logging: config.database.logging,
         pool: config.database.pool,
-        ...(isProduction && {
-          dialectOptions: {
+        dialectOptions: {
+          keepAlive: true,
+          ...(isProduction && {
             ssl: {
               require: true,
               rejectUnauthorized: false,
             },
-          },
-        }),
+          }),
+        },
         define: {
           schema: 'public',
           timestamps: true,
@@ -85,11 +85,12 @@ const createActivityLog = async (req, res) => {
         is_read: false,
       });
 
-      // Optionally send email notification
+      // Optionally send email notification in the background — the
+      // response shouldn't wait on an SMTP round-trip for a courtesy mail
       try {
         const owner = await User.findByPk(pet.user_id);
         if (owner && owner.email) {
-          await sendEmail({
+          sendEmail({
             to: owner.email,
             subject: `Pet Activity Update: ${pet.name}`,
             html: `
@@ -98,6 +99,8 @@ const createActivityLog = async (req, res) => {
               ${description ? `<p><strong>Details:</strong> ${description}</p>` : ''}
               <p>Log in to view more details.</p>
             `,
+          }).catch((emailError) => {
+            console.error('Error sending notification email:', emailError);
           });
         }
       } catch (emailError) {
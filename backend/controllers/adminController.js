@@ -1,5 +1,6 @@
 const { User, Booking, EmergencyRequest, ContactMessage, Pet, Notification } = require('../models');
 const { Op } = require('sequelize');
+const { invalidateUser } = require('../utils/userCache');
 
 /**
  * @desc    Get all users in the system
@@ -141,6 +142,7 @@ const updateUser = async (req, res) => {
     if (emergencyContactNumber !== undefined) user.emergencyContactNumber = emergencyContactNumber;
 
     await user.save();
+    invalidateUser(user.id);
 
     // Return updated user without password
     const updatedUser = user.toJSON();
@@ -199,6 +201,7 @@ const deleteUser = async (req, res) => {
     // Note: For permanent account deletion, only the user themselves can do it via deleteAccount
     user.isActive = false;
     await user.save();
+    invalidateUser(user.id);
     
     return res.status(200).json({
       success: true,
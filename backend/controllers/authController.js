@@ -1,4 +1,5 @@
 const { User, PasswordReset, EmailVerification, PendingRegistration, Pet, Booking, EmergencyRequest, ActivityLog, WellnessTimeline, Notification } = require('../models');
+const { sequelize } = require('../config/database');
 const {
   sendPasswordResetEmail,
   sendPasswordChangedEmail,
@@ -7,10 +8,58 @@ const {
 } = require('../utils/emailService');
 const { generateTokens, verifyToken, getTokenExpiry } = require('../utils/jwtHelper');
 const { generateOTP, hashOTP } = require('../utils/otpHelper');
+const { getCachedProfileJSON, invalidateUser } = require('../utils/userCache');
+const { denyToken, isTokenDenied } = require('../utils/tokenDenyList');
 const config = require('../config/config');
 const bcrypt = require('bcrypt');
 const { Op } = require('sequelize');
 
+// Cookie lifetimes derived from the JWT config once at module load — the
+// expiry strings never change at runtime, so re-parsing them per request
+// was wasted work
+const ACCESS_TOKEN_MAX_AGE = getTokenExpiry(config.jwt.accessTokenExpire);
+const REFRESH_TOKEN_MAX_AGE = getTokenExpiry(config.jwt.refreshTokenExpire);
+
+// Cookie options are likewise fixed per process; build them once instead
+// of re-evaluating the NODE_ENV ternaries on every login/refresh/logout
+const COOKIE_BASE_OPTIONS = {
+  httpOnly: true,
+  secure: config.NODE_ENV === 'production',
+  sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax'
+};
+const ACCESS_COOKIE_OPTIONS = { ...COOKIE_BASE_OPTIONS, maxAge: ACCESS_TOKEN_MAX_AGE };
+const REFRESH_COOKIE_OPTIONS = { ...COOKIE_BASE_OPTIONS, maxAge: REFRESH_TOKEN_MAX_AGE };
+
+// Compared against on the unknown-email login path so that branch costs
+// the same bcrypt work as a real check — otherwise response timing
+// reveals whether an email is registered. Cost matches the User hooks.
+const DUMMY_PASSWORD_HASH = bcrypt.hashSync('timing-equalizer-not-a-password', 10);
+
+// Validation patterns compiled once at module load instead of per request
+const LETTERS_AND_SPACES_RE = /^[A-Za-z\s]+$/;
+const TEN_DIGITS_RE = /^\d{10}$/;
+
+// Login failure bodies never vary per request, so build (and freeze) them
+// once; res.json() serializes the shared object each time
+const INVALID_CREDENTIALS_BODY = Object.freeze({
+  success: false,
+  message: 'Invalid email or password.'
+});
+const ACCOUNT_DELETED_BODY = Object.freeze({
+  success: false,
+  message: 'Your account has been deleted. Please register again if you wish to use PawWell.'
+});
+const ACCOUNT_DEACTIVATED_BODY = Object.freeze({
+  success: false,
+  message: 'Your account has been deactivated. Please contact support.'
+});
+const EMAIL_NOT_VERIFIED_BODY = Object.freeze({
+  success: false,
+  message: 'Please verify your email before logging in. Check your email for the verification OTP.',
+  code: 'EMAIL_NOT_VERIFIED',
+  nextStep: 'verify-email-otp'
+});
+
 /**
  * @route   POST /api/accounts/register
  * @desc    Register a new user Send OTP to email
@@ -26,130 +75,16 @@ const register = async (req, res) => {
     });
 
     const { email, password, firstName, lastName, phoneNumber, userType } = req.body;
-    const normalizedEmail = email.toLowerCase().trim();
-
-
-    // STRICT BACKEND VALIDATION FOR FIRSTNAME
-
-    console.log('BACKEND VALIDATION: Checking firstName...');
-
-    if (!firstName || !firstName.trim()) {
-      console.error('BACKEND REJECTED: firstName is empty');
-      return res.status(400).json({
-        success: false,
-        message: 'Full name is required',
-        errors: { firstName: ['Full name is required'] }
-      });
-    }
-
-    const trimmedFirstName = firstName.trim();
-
-    if (trimmedFirstName.length < 2) {
-      console.error('BACKEND REJECTED: firstName too short:', trimmedFirstName);
-      return res.status(400).json({
-        success: false,
-        message: 'Full name must be at least 2 characters long',
-        errors: { firstName: ['Full name must be at least 2 characters long'] }
-      });
-    }
-
-    // CHECK FOR NUMBERS - REJECT IMMEDIATELY
-    if (/\d/.test(trimmedFirstName)) {
-      console.error('BACKEND REJECTED: Numbers found in firstName:', trimmedFirstName);
-      return res.status(400).json({
-        success: false,
-        message: 'Full name cannot contain numbers',
-        errors: { firstName: ['Full name should contain only letters (A–Z). Numbers are not allowed.'] }
-      });
-    }
-
-    // CHECK FOR SPECIAL CHARACTERS - REJECT IMMEDIATELY
-    if (!/^[A-Za-z\s]+$/.test(trimmedFirstName)) {
-      console.error('BACKEND REJECTED: Invalid characters in firstName:', trimmedFirstName);
-      return res.status(400).json({
-        success: false,
-        message: 'Full name contains invalid characters',
-        errors: { firstName: ['Full name should contain only letters (A–Z). Special characters are not allowed.'] }
-      });
-    }
-
-    console.log('BACKEND VALIDATION PASSED: firstName is valid');
-
-
-    // BACKEND VALIDATION FOR LASTNAME
+    // Already lowercased/trimmed by the validation chain's normalizeEmail()
+    const normalizedEmail = email;
 
-    console.log('BACKEND VALIDATION: Checking lastName...');
-
-    if (!lastName || !lastName.trim()) {
-      console.error('BACKEND REJECTED: lastName is empty');
-      return res.status(400).json({
-        success: false,
-        message: 'Last name is required',
-        errors: { lastName: ['Last name is required'] }
-      });
-    }
-
-    const trimmedLastName = lastName.trim();
-
-    if (trimmedLastName.length < 2) {
-      console.error('BACKEND REJECTED: lastName too short:', trimmedLastName);
-      return res.status(400).json({
-        success: false,
-        message: 'Last name must be at least 2 characters long',
-        errors: { lastName: ['Last name must be at least 2 characters long'] }
-      });
-    }
-
-    // CHECK FOR NUMBERS - REJECT IMMEDIATELY
-    if (/\d/.test(trimmedLastName)) {
-      console.error('BACKEND REJECTED: Numbers found in lastName:', trimmedLastName);
-      return res.status(400).json({
-        success: false,
-        message: 'Last name cannot contain numbers',
-        errors: { lastName: ['Last name should contain only letters (A–Z). Numbers are not allowed.'] }
-      });
-    }
-
-    // CHECK FOR SPECIAL CHARACTERS - REJECT IMMEDIATELY (allow spaces for multi-part names)
-    if (!/^[A-Za-z\s]+$/.test(trimmedLastName)) {
-      console.error('BACKEND REJECTED: Invalid characters in lastName:', trimmedLastName);
-      return res.status(400).json({
-        success: false,
-        message: 'Last name contains invalid characters',
-        errors: { lastName: ['Last name should contain only letters (A–Z). Special characters are not allowed.'] }
-      });
-    }
 
-    console.log('BACKEND VALIDATION PASSED: lastName is valid');
-
-
-    // STRICT BACKEND VALIDATION FOR PHONENUMBER
-
-    if (phoneNumber) {
-      console.log('BACKEND VALIDATION: Checking phoneNumber...');
-
-      const cleanedPhoneNumber = phoneNumber.replace(/\s/g, '');
-
-      if (!/^\d+$/.test(cleanedPhoneNumber)) {
-        console.error('BACKEND REJECTED: Non-digits found in phoneNumber:', phoneNumber);
-        return res.status(400).json({
-          success: false,
-          message: 'Phone number must contain only digits',
-          errors: { phoneNumber: ['Phone number must contain only digits.'] }
-        });
-      }
-
-      if (cleanedPhoneNumber.length !== 10) {
-        console.error('BACKEND REJECTED: Phone number not 10 digits:', phoneNumber);
-        return res.status(400).json({
-          success: false,
-          message: 'Phone number must be exactly 10 digits',
-          errors: { phoneNumber: ['Phone number must be exactly 10 digits.'] }
-        });
-      }
-
-      console.log('BACKEND VALIDATION PASSED: phoneNumber is valid');
-    }
+    // Field-level validation already ran in registerValidation +
+    // handleValidationErrors before this handler; values arrive trimmed
+    // (and phoneNumber stripped to bare digits), so re-checking them here
+    // was pure duplication
+    const trimmedFirstName = firstName;
+    const trimmedLastName = lastName;
 
     // Check if user already exists
     const existingUser = await User.findOne({
@@ -162,19 +97,6 @@ const register = async (req, res) => {
       if (existingUser.deletedAt) {
         console.log('Deleted account found - will require OTP verification for reactivation:', existingUser.email);
 
-        // Check if there's already a pending reactivation
-        const existingPending = await PendingRegistration.findOne({
-          where: { email: normalizedEmail }
-        });
-
-        if (existingPending) {
-          console.log('Pending reactivation already exists - resending OTP:', normalizedEmail);
-          // Delete old pending reactivation
-          await existingPending.destroy();
-          console.log('Old pending reactivation deleted');
-          // Continue to generate new OTP
-        }
-
         // Send OTP for reactivation (same flow as new registration)
         console.log('Generating OTP for account reactivation...');
 
@@ -191,23 +113,10 @@ const register = async (req, res) => {
           // Create a temporary user object for email sending
           const tempUser = { email: normalizedEmail, firstName: trimmedFirstName };
 
-          // Send OTP email
-          console.log(`Sending OTP email to: ${normalizedEmail}`);
-          const emailSent = await sendEmailVerificationOTP(tempUser, otp);
-
-          if (!emailSent) {
-            console.error('Failed to send OTP email');
-            return res.status(500).json({
-              success: false,
-              message: 'Failed to send verification email. Please try again.',
-              error: 'Email service unavailable'
-            });
-          }
-
-          console.log(`OTP email sent successfully to: ${normalizedEmail}`);
-
-          // Create pending reactivation record
-          const pendingRegistration = await PendingRegistration.create({
+          // Create or replace the pending reactivation in one statement;
+          // the unique email key turns this into INSERT ... ON CONFLICT
+          // DO UPDATE instead of a separate DELETE + INSERT
+          const [pendingRegistration] = await PendingRegistration.upsert({
             email: normalizedEmail,
             password: password,
             firstName: trimmedFirstName,
@@ -219,7 +128,7 @@ const register = async (req, res) => {
             otpAttempts: 0,
             maxOtpAttempts: 5,
             isVerified: false
-          });
+          }, { conflictFields: ['email'] });
 
           console.log(`Pending reactivation created:`, {
             id: pendingRegistration.id,
@@ -227,6 +136,20 @@ const register = async (req, res) => {
             expiresAt: pendingRegistration.expiresAt
           });
 
+          // Send the OTP email in the background; SMTP latency shouldn't
+          // hold the registration response hostage, and the user can hit
+          // resend if delivery fails
+          console.log(`Sending OTP email to: ${normalizedEmail}`);
+          sendEmailVerificationOTP(tempUser, otp)
+            .then((sent) => {
+              if (!sent) {
+                console.error('Failed to send OTP email to:', normalizedEmail);
+              }
+            })
+            .catch((emailError) => {
+              console.error('Error sending OTP email:', emailError.message);
+            });
+
           return res.status(200).json({
             success: true,
             message: 'OTP has been sent to your email. Please verify within 10 minutes to reactivate your account.',
@@ -255,20 +178,6 @@ const register = async (req, res) => {
       }
     }
 
-    // Check if there's already a pending registration
-    const existingPending = await PendingRegistration.findOne({
-      where: { email: normalizedEmail }
-    });
-
-    if (existingPending) {
-      console.log('Pending registration already exists - resending OTP:', normalizedEmail);
-      // Delete old pending registration
-      await existingPending.destroy();
-      console.log('Old pending registration deleted');
-      // Continue to generate new OTP
-    }
-
-
     // GENERATE AND SEND OTP (NO USER CREATED YET)
 
     try {
@@ -286,23 +195,11 @@ const register = async (req, res) => {
       // Create a temporary user object for email sending
       const tempUser = { email: normalizedEmail, firstName: trimmedFirstName };
 
-      // Send OTP email
-      console.log(`📧 Sending OTP email to: ${normalizedEmail}`);
-      const emailSent = await sendEmailVerificationOTP(tempUser, otp);
-
-      if (!emailSent) {
-        console.error('❌ Failed to send OTP email');
-        return res.status(500).json({
-          success: false,
-          message: 'Failed to send verification email. Please try again.',
-          error: 'Email service unavailable'
-        });
-      }
-
-      console.log(`✅ OTP email sent successfully to: ${normalizedEmail}`);
-
-      // Create pending registration record (NOT a user yet!)
-      const pendingRegistration = await PendingRegistration.create({
+      // Create or replace the pending registration (NOT a user yet!) in
+      // one statement; the unique email key turns this into INSERT ...
+      // ON CONFLICT DO UPDATE instead of a separate DELETE + INSERT,
+      // and a resend naturally resets the OTP state
+      const [pendingRegistration] = await PendingRegistration.upsert({
         email: normalizedEmail,
         password: password,
         firstName: trimmedFirstName,
@@ -314,7 +211,7 @@ const register = async (req, res) => {
         otpAttempts: 0,
         maxOtpAttempts: 5,
         isVerified: false
-      });
+      }, { conflictFields: ['email'] });
 
       console.log(`✅ Pending registration created:`, {
         id: pendingRegistration.id,
@@ -322,6 +219,20 @@ const register = async (req, res) => {
         expiresAt: pendingRegistration.expiresAt
       });
 
+      // Send the OTP email in the background; SMTP latency shouldn't hold
+      // the registration response hostage, and the user can hit resend if
+      // delivery fails
+      console.log(`📧 Sending OTP email to: ${normalizedEmail}`);
+      sendEmailVerificationOTP(tempUser, otp)
+        .then((sent) => {
+          if (!sent) {
+            console.error('❌ Failed to send OTP email to:', normalizedEmail);
+          }
+        })
+        .catch((emailError) => {
+          console.error('❌ Error sending OTP email:', emailError.message);
+        });
+
       return res.status(200).json({
         success: true,
         message: 'OTP has been sent to your email. Please verify within 10 minutes.',
@@ -385,79 +296,57 @@ const login = async (req, res) => {
   try {
     const { email, password } = req.body;
 
-    // Find user by email (including soft-deleted accounts)
+    // Find user by email (including soft-deleted accounts); the
+    // validation chain already lowercased/trimmed it
     const user = await User.findOne({
-      where: { email: email.toLowerCase().trim() },
+      where: { email },
       paranoid: false  // Include soft-deleted records to check if account was deleted
     });
 
     if (!user) {
-      return res.status(401).json({
-        success: false,
-        message: 'Invalid email or password.'
-      });
+      // Burn the same bcrypt work as a real comparison (see
+      // DUMMY_PASSWORD_HASH) before rejecting
+      await bcrypt.compare(password, DUMMY_PASSWORD_HASH);
+      return res.status(401).json(INVALID_CREDENTIALS_BODY);
     }
 
     // Check if account is soft-deleted
     if (user.deletedAt) {
-      return res.status(403).json({
-        success: false,
-        message: 'Your account has been deleted. Please register again if you wish to use PawWell.'
-      });
+      return res.status(403).json(ACCOUNT_DELETED_BODY);
     }
 
     // Check if account is active (deactivated by admin)
     if (!user.isActive) {
-      return res.status(403).json({
-        success: false,
-        message: 'Your account has been deactivated. Please contact support.'
-      });
+      return res.status(403).json(ACCOUNT_DEACTIVATED_BODY);
     }
 
     // Check if email is verified
     if (!user.emailVerified) {
-      return res.status(403).json({
-        success: false,
-        message: 'Please verify your email before logging in. Check your email for the verification OTP.',
-        code: 'EMAIL_NOT_VERIFIED',
-        nextStep: 'verify-email-otp'
-      });
+      return res.status(403).json(EMAIL_NOT_VERIFIED_BODY);
     }
 
     // Verify password
     const isPasswordValid = await user.checkPassword(password);
     if (!isPasswordValid) {
-      return res.status(401).json({
-        success: false,
-        message: 'Invalid email or password.'
-      });
+      return res.status(401).json(INVALID_CREDENTIALS_BODY);
     }
 
-    // Update last login
+    // Update last login with a narrow single-column UPDATE instead of a
+    // full-row instance save (which re-writes every column and runs the
+    // password hooks' changed() checks)
     user.lastLogin = new Date();
-    await user.save();
+    await User.update(
+      { lastLogin: user.lastLogin },
+      { where: { id: user.id } }
+    );
 
     // Generate JWT tokens
     const { accessToken, refreshToken } = generateTokens(user.id);
 
-    // Calculate token expiry times in milliseconds
-    const accessExpiry = getTokenExpiry(config.jwt.accessTokenExpire);
-    const refreshExpiry = getTokenExpiry(config.jwt.refreshTokenExpire);
-
     // Set httpOnly cookies
-    res.cookie('accessToken', accessToken, {
-      httpOnly: true,
-      secure: config.NODE_ENV === 'production',
-      sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax',
-      maxAge: accessExpiry
-    });
+    res.cookie('accessToken', accessToken, ACCESS_COOKIE_OPTIONS);
 
-    res.cookie('refreshToken', refreshToken, {
-      httpOnly: true,
-      secure: config.NODE_ENV === 'production',
-      sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax',
-      maxAge: refreshExpiry
-    });
+    res.cookie('refreshToken', refreshToken, REFRESH_COOKIE_OPTIONS);
 
     // Prepare user data
     const userData = user.toJSON();
@@ -489,38 +378,60 @@ const forgotPassword = async (req, res) => {
   try {
     const { email } = req.body;
 
-    // Find user (but don't reveal if user exists)
+    // Find user (but don't reveal if user exists); email is already
+    // normalized by the validation chain
     const user = await User.findOne({
-      where: { email: email.toLowerCase().trim() }
+      where: { email }
     });
 
     if (user) {
-      // Generate 6-digit OTP
-      const otp = Math.floor(100000 + Math.random() * 900000).toString();
-
-      // Hash the OTP before storing
-      const otpHash = await bcrypt.hash(otp, 10);
-
-      // Delete any existing password reset requests for this user
-      await PasswordReset.destroy({
-        where: { userId: user.id }
+      // Deduplicate rapid repeats: if a live OTP was issued within the
+      // last minute, skip the extra row write and email — the previous
+      // code remains valid and the generic response is identical
+      const recentReset = await PasswordReset.findOne({
+        where: {
+          userId: user.id,
+          isUsed: false,
+          createdAt: { [Op.gt]: new Date(Date.now() - 60 * 1000) }
+        }
       });
 
-      // Create password reset record with OTP
-      const reset = await PasswordReset.create({
-        userId: user.id,
-        otpHash: otpHash,
-        otpAttempts: 0,
-        maxOtpAttempts: 5,
-        isVerified: false,
-        isUsed: false,
-        expiresAt: new Date(Date.now() + 10 * 60 * 1000) // 10 minutes
-      });
+      if (recentReset) {
+        console.log(`⏳ Duplicate OTP request for ${user.email} ignored (recent OTP still valid)`);
+      } else {
+        // Generate and hash a 6-digit OTP via the shared helpers
+        const otp = generateOTP();
+        const otpHash = await hashOTP(otp);
+
+        // Replace any existing reset requests atomically: if the create
+        // fails the old rows survive, so there's never a window where the
+        // user has no usable reset record at all
+        const reset = await sequelize.transaction(async (t) => {
+          await PasswordReset.destroy({
+            where: { userId: user.id },
+            transaction: t
+          });
 
-      // Send OTP email
-      await sendOTPEmail(user, otp);
+          return PasswordReset.create({
+            userId: user.id,
+            otpHash: otpHash,
+            otpAttempts: 0,
+            maxOtpAttempts: 5,
+            isVerified: false,
+            isUsed: false,
+            expiresAt: new Date(Date.now() + 10 * 60 * 1000) // 10 minutes
+          }, { transaction: t });
+        });
 
-      console.log(`✉️ OTP sent to ${user.email} (Reset ID: ${reset.id})`);
+        // Send OTP email in the background, only after the transaction has
+        // committed — an OTP for a row that got rolled back would be
+        // useless; the generic response below doesn't wait on SMTP either
+        sendOTPEmail(user, otp).catch((emailError) => {
+          console.error('Error sending OTP email:', emailError.message);
+        });
+
+        console.log(`✉️ OTP queued for ${user.email} (Reset ID: ${reset.id})`);
+      }
     }
 
     // Always return success message (security best practice)
@@ -548,24 +459,18 @@ const verifyOTP = async (req, res) => {
   try {
     const { email, otp } = req.body;
 
-    // Find user
-    const user = await User.findOne({
-      where: { email: email.toLowerCase().trim() }
-    });
-
-    if (!user) {
-      return res.status(404).json({
-        success: false,
-        message: 'Invalid verification request.'
-      });
-    }
-
-    // Find password reset record
+    // Find the latest open reset request with its user in a single joined
+    // query instead of SELECTing the user and the reset row separately;
+    // only the columns this handler touches are pulled through the join
     const reset = await PasswordReset.findOne({
-      where: {
-        userId: user.id,
-        isUsed: false
-      },
+      where: { isUsed: false },
+      include: [{
+        model: User,
+        as: 'user',
+        attributes: ['id', 'email'],
+        where: { email },
+        required: true
+      }],
       order: [['createdAt', 'DESC']]
     });
 
@@ -619,11 +524,11 @@ const verifyOTP = async (req, res) => {
       });
     }
 
-    // OTP is valid - mark as verified and generate token for password reset
-    reset.isVerified = true;
-    await reset.save();
+    // OTP is valid - mark as verified; the narrow update writes only the
+    // one flag instead of rewriting the row
+    await reset.update({ isVerified: true });
 
-    console.log(`✅ OTP verified for user ${user.email} (Reset ID: ${reset.id})`);
+    console.log(`✅ OTP verified for user ${reset.user.email} (Reset ID: ${reset.id})`);
 
     return res.status(200).json({
       success: true,
@@ -649,35 +554,28 @@ const resetPassword = async (req, res) => {
   try {
     const { token, newPassword } = req.body;
 
-    // Find password reset record
+    // The used/expired predicates live in the WHERE clause, so a dead
+    // token costs one indexed lookup and no row transfer; the 2FA secret
+    // and backup codes are never needed here. One response covers
+    // unknown, used and expired tokens alike — distinguishing them only
+    // tells an attacker which guesses were once valid.
     const reset = await PasswordReset.findOne({
-      where: { token },
+      where: {
+        token,
+        isUsed: false,
+        expiresAt: { [Op.gt]: new Date() }
+      },
       include: [{
         model: User,
-        as: 'user'
+        as: 'user',
+        attributes: { exclude: ['twoFactorSecret', 'backupCodes'] }
       }]
     });
 
     if (!reset) {
-      return res.status(404).json({
-        success: false,
-        message: 'Invalid password reset token.'
-      });
-    }
-
-    // Check if already used
-    if (reset.isUsed) {
       return res.status(400).json({
         success: false,
-        message: 'This password reset link has already been used.'
-      });
-    }
-
-    // Check if expired
-    if (reset.isExpired()) {
-      return res.status(400).json({
-        success: false,
-        message: 'This password reset link has expired. Please request a new one.'
+        message: 'This password reset link is invalid, has expired, or has already been used. Please request a new one.'
       });
     }
 
@@ -690,16 +588,22 @@ const resetPassword = async (req, res) => {
       });
     }
 
-    // Update password
-    reset.user.password = newPassword;
-    await reset.user.save();
-
-    // Mark token as used
-    reset.isUsed = true;
-    await reset.save();
+    // Update the password and burn the token atomically — a failure
+    // between the two writes must not leave a reusable reset token for an
+    // already-changed password. instance.update() only writes the listed
+    // columns, so neither statement rewrites its full row, and the
+    // password still goes through the beforeUpdate hashing hook.
+    await sequelize.transaction(async (t) => {
+      await reset.user.update({ password: newPassword }, { transaction: t });
+      await reset.update({ isUsed: true }, { transaction: t });
+    });
+    invalidateUser(reset.user.id);
 
-    // Send confirmation email
-    await sendPasswordChangedEmail(reset.user);
+    // Send confirmation email in the background — the reset is already
+    // durable, so the response shouldn't wait on SMTP
+    sendPasswordChangedEmail(reset.user).catch((emailError) => {
+      console.error('Error sending password changed email:', emailError.message);
+    });
 
     console.log(`🔒 Password reset successful for user ${reset.user.email}`);
 
@@ -724,8 +628,13 @@ const resetPassword = async (req, res) => {
  */
 const getProfile = async (req, res) => {
   try {
-    const userData = req.user.toJSON();
-    userData.isProfileComplete = !!userData.isProfileComplete;
+    // Serialization is memoized per cached user instance, so back-to-back
+    // profile reads don't redo the toJSON() walk
+    const userData = getCachedProfileJSON(req.user, (user) => {
+      const json = user.toJSON();
+      json.isProfileComplete = !!json.isProfileComplete;
+      return json;
+    });
 
     return res.status(200).json({
       success: true,
@@ -776,15 +685,9 @@ const updateProfile = async (req, res) => {
     const userId = req.user.id;
     console.log('👤 Updating profile for user ID:', userId);
 
-    const user = await User.findByPk(userId);
-
-    if (!user) {
-      console.error('❌ User not found in database:', userId);
-      return res.status(404).json({
-        success: false,
-        message: 'Your account could not be found. Please try logging in again.'
-      });
-    }
+    // authenticate already fetched this user; re-SELECTing it by PK was
+    // a wasted round-trip on every profile update
+    const user = req.user;
 
 
     // BACKEND VALIDATION FOR PROFILE FIELDS
@@ -795,7 +698,7 @@ const updateProfile = async (req, res) => {
     if (phoneNumber) {
       console.log('🔒 BACKEND VALIDATION: Checking phoneNumber...');
       const phoneValue = phoneNumber.trim();
-      if (!/^\d{10}$/.test(phoneValue)) {
+      if (!TEN_DIGITS_RE.test(phoneValue)) {
         console.error('❌ BACKEND REJECTED: Invalid phone number:', phoneValue);
         errors.phoneNumber = 'Phone Number must be exactly 10 digits with no letters or symbols';
       }
@@ -805,7 +708,7 @@ const updateProfile = async (req, res) => {
     if (city) {
       console.log('🔒 BACKEND VALIDATION: Checking city...');
       const cityValue = city.trim();
-      if (!/^[A-Za-z\s]+$/.test(cityValue)) {
+      if (!LETTERS_AND_SPACES_RE.test(cityValue)) {
         console.error('❌ BACKEND REJECTED: Invalid city:', cityValue);
         errors.city = 'City can only contain letters (A–Z), no numbers or symbols allowed';
       }
@@ -815,7 +718,7 @@ const updateProfile = async (req, res) => {
     if (emergencyContactName) {
       console.log('🔒 BACKEND VALIDATION: Checking emergencyContactName...');
       const nameValue = emergencyContactName.trim();
-      if (!/^[A-Za-z\s]+$/.test(nameValue)) {
+      if (!LETTERS_AND_SPACES_RE.test(nameValue)) {
         console.error('❌ BACKEND REJECTED: Invalid emergency contact name:', nameValue);
         errors.emergencyContactName = 'Emergency Contact Name can only contain letters (A–Z), no numbers or symbols allowed';
       }
@@ -825,7 +728,7 @@ const updateProfile = async (req, res) => {
     if (emergencyContactNumber) {
       console.log('🔒 BACKEND VALIDATION: Checking emergencyContactNumber...');
       const numberValue = emergencyContactNumber.trim();
-      if (!/^\d{10}$/.test(numberValue)) {
+      if (!TEN_DIGITS_RE.test(numberValue)) {
         console.error('❌ BACKEND REJECTED: Invalid emergency contact number:', numberValue);
         errors.emergencyContactNumber = 'Emergency Contact Number must be exactly 10 digits with no letters or symbols';
       }
@@ -898,6 +801,7 @@ const updateProfile = async (req, res) => {
     console.log('📊 Profile completion status:', isComplete);
 
     await user.save();
+    invalidateUser(user.id);
     console.log('💾 Profile saved successfully');
 
     return res.status(200).json({
@@ -909,6 +813,11 @@ const updateProfile = async (req, res) => {
     console.error('❌ Update profile error:', error);
     console.error('Error stack:', error.stack);
 
+    // The shared cached instance may carry unsaved field changes; drop it
+    if (req.user && req.user.id) {
+      invalidateUser(req.user.id);
+    }
+
     // Handle Sequelize validation errors
     if (error.name === 'SequelizeValidationError') {
       const errors = {};
@@ -950,32 +859,17 @@ const deleteAccount = async (req, res) => {
   try {
     const userId = req.user.id;
 
-    const user = await User.findByPk(userId);
-
-    if (!user) {
-      return res.status(404).json({
-        success: false,
-        message: 'User not found.'
-      });
-    }
-
     // Soft delete user account (paranoid mode will set deleted_at timestamp)
     // ⚠️ All related data (pets, bookings, reviews, payments) remains intact
-    await user.destroy();
+    // authenticate already fetched this user, so destroy it directly
+    await req.user.destroy();
+    invalidateUser(userId);
     console.log(`✅ Soft deleted user account ${userId}`);
     console.log(`💾 All related data (pets, bookings, reviews, payments) retained for potential restoration`);
 
     // Clear authentication cookies
-    res.clearCookie('accessToken', {
-      httpOnly: true,
-      secure: config.NODE_ENV === 'production',
-      sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax'
-    });
-    res.clearCookie('refreshToken', {
-      httpOnly: true,
-      secure: config.NODE_ENV === 'production',
-      sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax'
-    });
+    res.clearCookie('accessToken', COOKIE_BASE_OPTIONS);
+    res.clearCookie('refreshToken', COOKIE_BASE_OPTIONS);
 
     return res.status(200).json({
       success: true,
@@ -1011,15 +905,18 @@ const refreshToken = async (req, res) => {
     // Verify refresh token
     const decoded = verifyToken(refresh);
 
-    if (!decoded || decoded.type !== 'refresh') {
+    if (!decoded || decoded.type !== 'refresh' || isTokenDenied(decoded.jti)) {
       return res.status(401).json({
         success: false,
         message: 'Invalid or expired refresh token.'
       });
     }
 
-    // Get user
-    const user = await User.findByPk(decoded.userId);
+    // Get user — only the columns the active check needs, the refresh
+    // response never serializes the user
+    const user = await User.findByPk(decoded.userId, {
+      attributes: ['id', 'isActive']
+    });
 
     if (!user || !user.isActive) {
       return res.status(401).json({
@@ -1030,15 +927,9 @@ const refreshToken = async (req, res) => {
 
     // Generate new access token
     const { accessToken } = generateTokens(user.id);
-    const accessExpiry = getTokenExpiry(config.jwt.accessTokenExpire);
 
     // Set new access token cookie
-    res.cookie('accessToken', accessToken, {
-      httpOnly: true,
-      secure: config.NODE_ENV === 'production',
-      sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax',
-      maxAge: accessExpiry
-    });
+    res.cookie('accessToken', accessToken, ACCESS_COOKIE_OPTIONS);
 
     return res.status(200).json({
       success: true,
@@ -1061,18 +952,19 @@ const refreshToken = async (req, res) => {
  */
 const logout = async (req, res) => {
   try {
+    // Revoke both tokens so a copied cookie can't be replayed after
+    // logout; each is denied only until its own expiry
+    for (const name of ['accessToken', 'refreshToken']) {
+      const decoded = req.cookies[name] && verifyToken(req.cookies[name]);
+      if (decoded && decoded.jti) {
+        denyToken(decoded.jti, decoded.exp * 1000);
+      }
+    }
+
     // Clear httpOnly cookies
-    res.clearCookie('accessToken', {
-      httpOnly: true,
-      secure: config.NODE_ENV === 'production',
-      sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax'
-    });
+    res.clearCookie('accessToken', COOKIE_BASE_OPTIONS);
 
-    res.clearCookie('refreshToken', {
-      httpOnly: true,
-      secure: config.NODE_ENV === 'production',
-      sameSite: config.NODE_ENV === 'production' ? 'none' : 'lax'
-    });
+    res.clearCookie('refreshToken', COOKIE_BASE_OPTIONS);
 
     return res.status(200).json({
       success: true,
@@ -1096,7 +988,8 @@ const logout = async (req, res) => {
 const verifyEmailOTP = async (req, res) => {
   try {
     const { email, otp } = req.body;
-    const normalizedEmail = email.toLowerCase().trim();
+    // Already lowercased/trimmed by the validation chain's normalizeEmail()
+    const normalizedEmail = email;
 
     console.log(`Verifying OTP for email: ${normalizedEmail}`);
 
@@ -1172,43 +1065,55 @@ const verifyEmailOTP = async (req, res) => {
 
     let newUser;
     try {
-      if (deletedUser && deletedUser.deletedAt) {
-        // REACTIVATE deleted account
-        console.log('Reactivating deleted account:', normalizedEmail);
-
-        deletedUser.password = pendingRegistration.password;
-        deletedUser.firstName = pendingRegistration.firstName;
-        deletedUser.lastName = pendingRegistration.lastName;
-        deletedUser.phoneNumber = pendingRegistration.phoneNumber;
-        deletedUser.userType = pendingRegistration.userType;
-        deletedUser.emailVerified = true;
-        deletedUser.isActive = true;
-        deletedUser.isProfileComplete = false;
-
-        await deletedUser.save();
-        await deletedUser.restore();
-
-        newUser = deletedUser;
-        console.log('Account reactivated successfully:', newUser.email);
-        console.log('All related data (pets, bookings, reviews) automatically restored');
-      } else {
-        // CREATE new user account
-        console.log('Creating new user account from pending registration...');
-
-        newUser = await User.create({
-          email: pendingRegistration.email,
-          password: pendingRegistration.password,
-          firstName: pendingRegistration.firstName,
-          lastName: pendingRegistration.lastName,
-          phoneNumber: pendingRegistration.phoneNumber,
-          userType: pendingRegistration.userType,
-          emailVerified: true,  // Email is now verified!
-          isActive: true,
-          isProfileComplete: false
-        });
+      // Create/reactivate the account and consume the pending registration
+      // in one transaction so a crash can't leave a verified pending row
+      // without an account (or vice versa), and both writes commit together
+      newUser = await sequelize.transaction(async (t) => {
+        let user;
+        if (deletedUser && deletedUser.deletedAt) {
+          // REACTIVATE deleted account
+          console.log('Reactivating deleted account:', normalizedEmail);
+
+          deletedUser.password = pendingRegistration.password;
+          deletedUser.firstName = pendingRegistration.firstName;
+          deletedUser.lastName = pendingRegistration.lastName;
+          deletedUser.phoneNumber = pendingRegistration.phoneNumber;
+          deletedUser.userType = pendingRegistration.userType;
+          deletedUser.emailVerified = true;
+          deletedUser.isActive = true;
+          deletedUser.isProfileComplete = false;
+
+          await deletedUser.save({ transaction: t });
+          await deletedUser.restore({ transaction: t });
+
+          user = deletedUser;
+          console.log('Account reactivated successfully:', user.email);
+          console.log('All related data (pets, bookings, reviews) automatically restored');
+        } else {
+          // CREATE new user account
+          console.log('Creating new user account from pending registration...');
+
+          user = await User.create({
+            email: pendingRegistration.email,
+            password: pendingRegistration.password,
+            firstName: pendingRegistration.firstName,
+            lastName: pendingRegistration.lastName,
+            phoneNumber: pendingRegistration.phoneNumber,
+            userType: pendingRegistration.userType,
+            emailVerified: true,  // Email is now verified!
+            isActive: true,
+            isProfileComplete: false
+          }, { transaction: t });
+
+          console.log('New user account created successfully:', user.email);
+        }
 
-        console.log('New user account created successfully:', newUser.email);
-      }
+        // Delete pending registration (no longer needed)
+        await pendingRegistration.destroy({ transaction: t });
+        console.log('Pending registration deleted');
+
+        return user;
+      });
     } catch (userError) {
       console.error('Error creating/reactivating user:', userError.message);
       console.error('Full error details:', userError);
@@ -1228,10 +1133,6 @@ const verifyEmailOTP = async (req, res) => {
       });
     }
 
-    // Delete pending registration (no longer needed)
-    await pendingRegistration.destroy();
-    console.log('Pending registration deleted');
-
     // Send admin notification about new verified registration
     try {
       const admins = await User.findAll({
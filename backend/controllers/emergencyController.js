@@ -86,11 +86,15 @@ const createEmergencyRequest = async (req, res) => {
       `;
       const text = `New Emergency Request\nPet: ${pet.name}\nOwner: ${ownerName || 'Unknown'}\nType: ${emergency_type}\nContact: ${contactInfo}\nDescription: ${description}`;
 
-      await sendEmail({
+      // Fire-and-forget: the admin alert shouldn't delay the emergency
+      // response, and sendEmail already swallows and logs SMTP errors
+      sendEmail({
         to: config.email.auth.user,
         subject,
         html,
         text
+      }).catch((emailError) => {
+        console.error('Error sending emergency alert email:', emailError);
       });
     }
 
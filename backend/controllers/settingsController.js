@@ -1,6 +1,7 @@
 const { UserSettings, User } = require('../models');
 const { Op } = require('sequelize');
 const bcrypt = require('bcrypt');
+const { invalidateUser } = require('../utils/userCache');
 
 /**
  * Get user settings
@@ -210,6 +211,7 @@ exports.changePassword = async (req, res) => {
     // Update password (model hooks will handle hashing)
     user.password = newPassword;
     await user.save();
+    invalidateUser(user.id);
 
     console.log(`Password changed successfully for user ${user.email}`);
 
@@ -287,6 +289,7 @@ exports.changeEmail = async (req, res) => {
     // Update email
     user.email = normalizedEmail;
     await user.save();
+    invalidateUser(user.id);
 
     console.log(`📧 Email changed successfully for user ${userId}: ${user.email}`);
 
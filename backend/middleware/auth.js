@@ -2,6 +2,14 @@ const jwt = require('jsonwebtoken');
 const config = require('../config/config');
 const { User } = require('../models');
 const { ROLES, hasRole, isAdmin } = require('../utils/rbac');
+const { getCachedUser } = require('../utils/userCache');
+const { isTokenDenied } = require('../utils/tokenDenyList');
+
+// Columns no request handler reads off req.user (toJSON strips them too);
+// skipping them narrows the row fetched on every authenticated request
+const USER_FETCH_OPTIONS = {
+  attributes: { exclude: ['password', 'twoFactorSecret', 'backupCodes'] }
+};
 
 /**
  * Middleware to verify JWT token and authenticate user
@@ -36,8 +44,17 @@ const authenticate = async (req, res, next) => {
     const decoded = jwt.verify(token, config.jwt.secret);
     console.log('✅ Token decoded:', { userId: decoded.userId, userType: decoded.userType });
 
-    // Get user from database
-    const user = await User.findByPk(decoded.userId);
+    // Reject tokens revoked by logout
+    if (isTokenDenied(decoded.jti)) {
+      console.log('❌ Token has been revoked');
+      return res.status(401).json({
+        success: false,
+        message: 'Token has been revoked. Please login again.'
+      });
+    }
+
+    // Get user from cache or database
+    const user = await getCachedUser(decoded.userId, (id) => User.findByPk(id, USER_FETCH_OPTIONS));
 
     if (!user) {
       console.log('❌ User not found in database');
@@ -106,7 +123,12 @@ const optionalAuthenticate = async (req, res, next) => {
     }
 
     const decoded = jwt.verify(token, config.jwt.secret);
-    const user = await User.findByPk(decoded.userId);
+
+    if (isTokenDenied(decoded.jti)) {
+      return next();
+    }
+
+    const user = await getCachedUser(decoded.userId, (id) => User.findByPk(id, USER_FETCH_OPTIONS));
 
     if (user && user.isActive) {
       req.user = user;
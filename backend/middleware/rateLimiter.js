@@ -35,6 +35,12 @@ const authLimiter = rateLimit({
 const passwordResetLimiter = rateLimit({
   windowMs: 60 * 60 * 1000, // 1 hour
   max: 3, // 3 requests per hour
+  // Key on the target email when present so one mailbox can't be flooded
+  // from many IPs (and a shared NAT doesn't exhaust everyone's quota)
+  keyGenerator: (req) =>
+    req.body && req.body.email
+      ? String(req.body.email).toLowerCase().trim()
+      : req.ip,
   message: {
     success: false,
     message: 'Too many password reset requests, please try again later.'
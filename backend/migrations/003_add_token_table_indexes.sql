@@ -0,0 +1,19 @@
+-- Add partial indexes on the token tables so active-row lookups stay fast
+-- as dead (used/verified/expired) rows accumulate between cleanups.
+-- Run with: psql -d pawwell_db -f migrations/003_add_token_table_indexes.sql
+
+-- password_resets: OTP verification fetches the latest unused row per user
+CREATE INDEX IF NOT EXISTS pr_active_user_idx
+  ON password_resets (user_id)
+  WHERE is_used = false;
+
+CREATE INDEX IF NOT EXISTS pr_expires_at_idx
+  ON password_resets (expires_at);
+
+-- email_verifications: lookups only ever target unverified rows
+CREATE INDEX IF NOT EXISTS ev_active_user_idx
+  ON email_verifications (user_id)
+  WHERE is_verified = false;
+
+CREATE INDEX IF NOT EXISTS ev_expires_at_idx
+  ON email_verifications (expires_at);
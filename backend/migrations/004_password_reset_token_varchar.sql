@@ -0,0 +1,6 @@
+-- Store password reset tokens as URL-safe base64 strings instead of UUIDs.
+-- Existing UUID tokens are kept as their text form and remain valid.
+-- Run with: psql -d pawwell_db -f migrations/004_password_reset_token_varchar.sql
+
+ALTER TABLE password_resets
+  ALTER COLUMN token TYPE VARCHAR(43) USING token::text;
@@ -0,0 +1,13 @@
+-- Indexes for admin user listings and analytics queries.
+-- getAllUsers filters by user_type and orders by date_joined DESC with
+-- LIMIT/OFFSET pagination; without these, Postgres sorts the whole users
+-- table on every page load.
+-- sync({ alter: false }) does not create indexes on existing tables, so
+-- apply manually:
+--   psql -d pawwell -f backend/migrations/005_add_user_listing_indexes.sql
+
+CREATE INDEX IF NOT EXISTS user_type_joined_idx
+  ON users (user_type, date_joined DESC);
+
+CREATE INDEX IF NOT EXISTS user_date_joined_idx
+  ON users (date_joined DESC);
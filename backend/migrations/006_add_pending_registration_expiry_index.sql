@@ -0,0 +1,10 @@
+-- Index for the expired-row cleanup range scan on pending_registrations.
+-- password_resets and email_verifications got their expires_at indexes in
+-- 003; this covers the remaining token table. Lookups by email are
+-- already served by the unique constraint.
+-- sync({ alter: false }) does not create indexes on existing tables, so
+-- apply manually:
+--   psql -d pawwell -f backend/migrations/006_add_pending_registration_expiry_index.sql
+
+CREATE INDEX IF NOT EXISTS pending_reg_expires_at_idx
+  ON pending_registrations (expires_at);
@@ -41,6 +41,8 @@ const EmailVerification = sequelize.define('EmailVerification', {
   expiresAt: {
     type: DataTypes.DATE,
     allowNull: false,
+    // 10 minutes from creation (OTP lifetime), mirroring PasswordReset
+    defaultValue: () => new Date(Date.now() + 10 * 60 * 1000),
     field: 'expires_at'
   },
   createdAt: {
@@ -56,7 +58,20 @@ const EmailVerification = sequelize.define('EmailVerification', {
 }, {
   tableName: 'email_verifications',
   timestamps: true,
-  underscored: false
+  underscored: false,
+  indexes: [
+    {
+      // Partial index: lookups only ever target unverified rows
+      name: 'ev_active_user_idx',
+      fields: ['user_id'],
+      where: { is_verified: false }
+    },
+    {
+      // Supports the expired-row cleanup range scan
+      name: 'ev_expires_at_idx',
+      fields: ['expires_at']
+    }
+  ]
 });
 
 // Helper method to check if OTP is expired
@@ -64,10 +79,9 @@ EmailVerification.prototype.isExpired = function() {
   return new Date() > this.expiresAt;
 };
 
-// Helper method to increment attempts
+// Helper method to increment attempts (atomic single-column UPDATE)
 EmailVerification.prototype.incrementAttempts = async function() {
-  this.otpAttempts += 1;
-  await this.save();
+  await this.increment('otpAttempts');
 };
 
 // Helper method to verify OTP
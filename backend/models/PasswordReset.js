@@ -1,6 +1,10 @@
 const { DataTypes } = require('sequelize');
 const { sequelize } = require('../config/database');
-const { v4: uuidv4 } = require('uuid');
+const crypto = require('crypto');
+
+// 32 random bytes -> 43-char base64url string. Same entropy class as a
+// UUID4 but URL-ready without escaping and cheaper to generate/compare.
+const generateResetToken = () => crypto.randomBytes(32).toString('base64url');
 
 const PasswordReset = sequelize.define('PasswordReset', {
   id: {
@@ -19,8 +23,8 @@ const PasswordReset = sequelize.define('PasswordReset', {
     onDelete: 'CASCADE'
   },
   token: {
-    type: DataTypes.UUID,
-    defaultValue: uuidv4,
+    type: DataTypes.STRING(43),
+    defaultValue: generateResetToken,
     unique: true,
     allowNull: true  // Make optional since we're using OTP
   },
@@ -53,6 +57,10 @@ const PasswordReset = sequelize.define('PasswordReset', {
   expiresAt: {
     type: DataTypes.DATE,
     allowNull: false,
+    // 10 minutes from creation (OTP lifetime); a field default lets
+    // Sequelize take the plain insert path and works with bulkCreate,
+    // unlike the old beforeCreate hook
+    defaultValue: () => new Date(Date.now() + 10 * 60 * 1000),
     field: 'expires_at'
   },
   createdAt: {
@@ -63,14 +71,20 @@ const PasswordReset = sequelize.define('PasswordReset', {
 }, {
   tableName: 'password_resets',
   timestamps: false,
-  hooks: {
-    beforeCreate: (reset) => {
-      if (!reset.expiresAt) {
-        // Set expiration to 10 minutes from now for OTP
-        reset.expiresAt = new Date(Date.now() + 10 * 60 * 1000);
-      }
+  indexes: [
+    {
+      // Partial index: OTP verification looks rows up by user with
+      // is_used = false, and dead rows accumulate until cleanup runs
+      name: 'pr_active_user_idx',
+      fields: ['user_id'],
+      where: { is_used: false }
+    },
+    {
+      // Supports the expired-row cleanup range scan
+      name: 'pr_expires_at_idx',
+      fields: ['expires_at']
     }
-  }
+  ]
 });
 
 // Instance methods
@@ -88,8 +102,9 @@ PasswordReset.prototype.canVerifyOtp = function() {
 };
 
 PasswordReset.prototype.incrementAttempts = function() {
-  this.otpAttempts += 1;
-  return this.save();
+  // Atomic SET otp_attempts = otp_attempts + 1 — one narrow UPDATE, safe
+  // under concurrent attempts, instead of a read-modify-write save()
+  return this.increment('otpAttempts');
 };
 
 module.exports = PasswordReset;
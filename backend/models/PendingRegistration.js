@@ -11,7 +11,12 @@ const PendingRegistration = sequelize.define('PendingRegistration', {
     type: DataTypes.STRING,
     allowNull: false,
     unique: true,
-    field: 'email'
+    field: 'email',
+    // Same normalization as User.email — the unique constraint and the
+    // verify-email lookup both assume one canonical casing per address
+    set(value) {
+      this.setDataValue('email', value.toLowerCase().trim());
+    }
   },
   password: {
     type: DataTypes.STRING,
@@ -70,7 +75,15 @@ const PendingRegistration = sequelize.define('PendingRegistration', {
   }
 }, {
   tableName: 'pending_registrations',
-  timestamps: false
+  timestamps: false,
+  indexes: [
+    {
+      // Supports the expired-row cleanup range scan; the lookup key
+      // (email) is already covered by its unique constraint
+      name: 'pending_reg_expires_at_idx',
+      fields: ['expires_at']
+    }
+  ]
 });
 
 // Helper methods
@@ -79,8 +92,8 @@ PendingRegistration.prototype.isExpired = function() {
 };
 
 PendingRegistration.prototype.incrementAttempts = async function() {
-  this.otpAttempts += 1;
-  await this.save();
+  // Atomic single-column UPDATE, safe under concurrent attempts
+  await this.increment('otpAttempts');
 };
 
 PendingRegistration.prototype.verifyOTP = async function(otp) {
@@ -1,6 +1,8 @@
 const { DataTypes } = require('sequelize');
 const { sequelize } = require('../config/database');
-const bcrypt = require('bcryptjs');
+// Native bcrypt (used everywhere else in the codebase) hashes in C
+// instead of pure JS — same $2b$ format, so existing hashes still verify
+const bcrypt = require('bcrypt');
 
 const User = sequelize.define('User', {
   id: {
@@ -216,6 +218,18 @@ const User = sequelize.define('User', {
   paranoid: true,
   createdAt: 'dateJoined',
   updatedAt: false,
+  indexes: [
+    {
+      // Admin user listing filters by type and orders by join date
+      name: 'user_type_joined_idx',
+      fields: ['user_type', { name: 'date_joined', order: 'DESC' }]
+    },
+    {
+      // Unfiltered listing / analytics ordered by join date
+      name: 'user_date_joined_idx',
+      fields: [{ name: 'date_joined', order: 'DESC' }]
+    }
+  ],
   hooks: {
     beforeCreate: async (user) => {
       if (user.password) {
@@ -246,12 +260,16 @@ User.prototype.getShortName = function() {
 };
 
 User.prototype.toJSON = function() {
-  const values = { ...this.get() };
+  // get() already materializes a fresh plain object, so spreading it into
+  // another object literal just doubled the copy on every serialization
+  const values = this.get({ plain: true });
   delete values.password;
   delete values.twoFactorSecret; // Don't expose secret
   delete values.backupCodes; // Don't expose backup codes
-  // Add fullName as a virtual field for easier frontend access
-  values.fullName = this.getFullName();
+  // Add fullName as a virtual field for easier frontend access; built from
+  // the values already materialized above instead of going back through
+  // the per-attribute getter machinery via getFullName()
+  values.fullName = `${values.firstName} ${values.lastName}`.trim();
   return values;
 };
 
@@ -86,6 +86,7 @@ router.post(
  */
 router.post(
   '/reset-password',
+  otpVerificationLimiter,
   resetPasswordValidation,
   handleValidationErrors,
   authController.resetPassword
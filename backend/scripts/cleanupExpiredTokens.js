@@ -0,0 +1,54 @@
+/**
+ * Delete expired/consumed OTP and token rows.
+ *
+ * password_resets, email_verifications and pending_registrations grow on
+ * every forgot-password / registration attempt and are never pruned, which
+ * bloats their indexes and slows the hot token lookups over time. This
+ * script bulk-deletes rows that are expired or already consumed.
+ *
+ * Run manually with `npm run db:cleanup` or schedule it hourly via cron:
+ *   0 * * * * cd /path/to/backend && node scripts/cleanupExpiredTokens.js
+ */
+
+const { Op } = require('sequelize');
+const { PasswordReset, EmailVerification, PendingRegistration } = require('../models');
+
+async function cleanupExpiredTokens() {
+  try {
+    const now = new Date();
+
+    const resetCount = await PasswordReset.destroy({
+      where: {
+        [Op.or]: [
+          { expiresAt: { [Op.lt]: now } },
+          { isUsed: true }
+        ]
+      }
+    });
+
+    const verificationCount = await EmailVerification.destroy({
+      where: {
+        [Op.or]: [
+          { expiresAt: { [Op.lt]: now } },
+          { isVerified: true }
+        ]
+      }
+    });
+
+    const pendingCount = await PendingRegistration.destroy({
+      where: { expiresAt: { [Op.lt]: now } }
+    });
+
+    console.log('🧹 Token cleanup complete');
+    console.log(`   - password_resets deleted: ${resetCount}`);
+    console.log(`   - email_verifications deleted: ${verificationCount}`);
+    console.log(`   - pending_registrations deleted: ${pendingCount}`);
+
+    process.exit(0);
+  } catch (error) {
+    console.error('Error cleaning up expired tokens:', error.message);
+    process.exit(1);
+  }
+}
+
+cleanupExpiredTokens();
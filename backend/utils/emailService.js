@@ -1,87 +1,85 @@
 const nodemailer = require('nodemailer');
 const config = require('../config/config');
+const logger = require('./logger');
 
-// Create reusable transporter
+// Create reusable transporter. pool: true keeps SMTP connections open
+// across sends so repeated OTP/reset mails reuse the TCP+TLS+AUTH
+// handshake instead of paying it per message.
 const transporter = nodemailer.createTransport({
   host: config.email.host,
   port: config.email.port,
   secure: config.email.secure,
-  auth: config.email.auth
+  auth: config.email.auth,
+  pool: true,
+  maxConnections: 3,
+  maxMessages: 100,
+  // Bodies always contain non-ASCII (emoji, ©), so pin the transfer
+  // encoding instead of letting nodemailer re-scan ~3 KB of content per
+  // message to pick one
+  textEncoding: 'quoted-printable'
 });
 
+// ---------------------------------------------------------------------------
+// Templates
+//
+// Each body is built once at module load as a constant with {placeholder}
+// slots; sends only substitute the per-recipient values instead of
+// rebuilding ~3 KB of HTML through a template literal on every call.
+//
+// The document shell (doctype, stylesheet, branded header, footer) is
+// shared: every template used to carry its own near-identical copy of the
+// CSS, so the rules live once here and wrapEmailBody() composes the full
+// document per template at module load.
+// ---------------------------------------------------------------------------
+
+// CSS braces never match ({ is always followed by whitespace in the
+// stylesheet), so only real {placeholder} slots are touched
+const PLACEHOLDER_RE = /\{(\w+)\}/g;
+
 /**
- * Send password reset email
+ * Substitute {key} placeholders in a template with values from context.
+ *
+ * Single pass over the template regardless of how many placeholders it
+ * has; unknown keys are left as-is.
  */
-const sendPasswordResetEmail = async (user, token) => {
-  const resetLink = `${config.frontendUrl}/reset-password?token=${token}`;
-
-  const htmlMessage = `
+const renderTemplate = (template, context) =>
+  template.replace(PLACEHOLDER_RE, (match, key) =>
+    key in context ? context[key] : match
+  );
+
+// Union of the rules previously duplicated across all four templates;
+// templates that don't use a class simply carry a few unused rules, which
+// is far cheaper than four diverging copies. One rule per line keeps the
+// block small on the wire while staying editable.
+// (A hosted stylesheet via <link> was considered and rejected: Gmail and
+// most other clients strip it, so the CSS has to ride along inline.)
+const EMAIL_STYLES = `
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px; }
+            .header { background-color: #4A90E2; color: white; padding: 20px; text-align: center; border-radius: 5px 5px 0 0; }
+            .content { background-color: #f9f9f9; padding: 30px; border: 1px solid #ddd; }
+            .button { display: inline-block; padding: 12px 30px; background-color: #4A90E2; color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }
+            .otp-box { background-color: #ffffff; border: 2px dashed #4A90E2; padding: 20px; text-align: center; margin: 20px 0; border-radius: 8px; }
+            .otp-code { font-size: 32px; font-weight: bold; color: #4A90E2; letter-spacing: 5px; font-family: 'Courier New', monospace; }
+            .footer { text-align: center; padding: 20px; font-size: 12px; color: #666; }
+            .warning { background-color: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0; }
+            .success { background-color: #d4edda; padding: 15px; border-left: 4px solid #28a745; margin: 20px 0; }
+            .info { background-color: #d1ecf1; padding: 15px; border-left: 4px solid #17a2b8; margin: 20px 0; }
+`;
+
+const EMAIL_HEAD = `
     <!DOCTYPE html>
     <html>
     <head>
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 600px;
-                margin: 0 auto;
-                padding: 20px;
-            }
-            .header {
-                background-color: #4A90E2;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                border-radius: 5px 5px 0 0;
-            }
-            .content {
-                background-color: #f9f9f9;
-                padding: 30px;
-                border: 1px solid #ddd;
-            }
-            .button {
-                display: inline-block;
-                padding: 12px 30px;
-                background-color: #4A90E2;
-                color: white;
-                text-decoration: none;
-                border-radius: 5px;
-                margin: 20px 0;
-            }
-            .footer {
-                text-align: center;
-                padding: 20px;
-                font-size: 12px;
-                color: #666;
-            }
-            .warning {
-                background-color: #fff3cd;
-                padding: 15px;
-                border-left: 4px solid #ffc107;
-                margin: 20px 0;
-            }
-        </style>
+        <style>${EMAIL_STYLES}        </style>
     </head>
     <body>
         <div class="header">
             <h1>🐾 PawWell Care Center</h1>
         </div>
         <div class="content">
-            <h2>Password Reset Request</h2>
-            <p>Hi ${user.firstName},</p>
-            <p>We received a request to reset your password for your PawWell Care Center account.</p>
-            <p>Click the button below to reset your password:</p>
-            <div style="text-align: center;">
-                <a href="${resetLink}" class="button">Reset Password</a>
-            </div>
-            <p>Or copy and paste this link into your browser:</p>
-            <p style="word-break: break-all; color: #4A90E2;">${resetLink}</p>
-            <p><strong>Note:</strong> This link will expire in 1 hour.</p>
-            <div class="warning">
-                <p><strong>⚠️ Security Notice:</strong></p>
-                <p>If you didn't request a password reset, please ignore this email and ensure your account is secure.</p>
-            </div>
+`;
+
+const EMAIL_FOOT = `
         </div>
         <div class="footer">
             <p>&copy; 2025 PawWell Care Center. All rights reserved.</p>
@@ -91,210 +89,76 @@ const sendPasswordResetEmail = async (user, token) => {
     </html>
   `;
 
-  const textMessage = `
-Password Reset Request
-
-Hi ${user.firstName},
-
-We received a request to reset your password for your PawWell Care Center account.
-
-Click this link to reset your password:
-${resetLink}
+// Drop the indentation whitespace between tags once at module load;
+// the pretty-printed source is ~40% padding that would otherwise be
+// serialized and pushed through the SMTP socket on every send. CSS text
+// is untouched (the pattern needs a closing > before the whitespace).
+const minifyHtml = (html) => html.replace(/>\s+</g, '><').trim();
 
-Note: This link will expire in 1 hour.
-
-⚠️ Security Notice:
-If you didn't request a password reset, please ignore this email and ensure your account is secure.
-
-© 2025 PawWell Care Center. All rights reserved.
-  `;
-
-  try {
-    await transporter.sendMail({
-      from: config.email.from,
-      to: user.email,
-      subject: 'Password Reset - PawWell Care Center',
-      text: textMessage,
-      html: htmlMessage
-    });
-    return true;
-  } catch (error) {
-    console.error('Error sending password reset email:', error);
-    return false;
-  }
-};
+const wrapEmailBody = (content) => minifyHtml(EMAIL_HEAD + content + EMAIL_FOOT);
 
 /**
- * Send password changed confirmation email
+ * Derive a plain-text body from an HTML template.
+ *
+ * Runs once per template at module load, so the text variant can never
+ * drift from the HTML the way the hand-maintained duplicates could.
+ * Operates on the minified form: block-level closing tags become the
+ * paragraph breaks.
  */
-const sendPasswordChangedEmail = async (user) => {
-  const htmlMessage = `
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 600px;
-                margin: 0 auto;
-                padding: 20px;
-            }
-            .header {
-                background-color: #4A90E2;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                border-radius: 5px 5px 0 0;
-            }
-            .content {
-                background-color: #f9f9f9;
-                padding: 30px;
-                border: 1px solid #ddd;
-            }
-            .footer {
-                text-align: center;
-                padding: 20px;
-                font-size: 12px;
-                color: #666;
-            }
-            .success {
-                background-color: #d4edda;
-                padding: 15px;
-                border-left: 4px solid #28a745;
-                margin: 20px 0;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>🐾 PawWell Care Center</h1>
-        </div>
-        <div class="content">
+const htmlToText = (html) =>
+  html
+    .replace(/<style>[\s\S]*?<\/style>/, '')
+    .replace(/<\/li>/g, '\n')
+    .replace(/<\/(?:p|div|h\d|ul)>/g, '\n\n')
+    .replace(/<[^>]+>/g, '')
+    .replace(/&copy;/g, '©')
+    .replace(/&amp;/g, '&')
+    .replace(/[ \t]+/g, ' ')
+    .replace(/\n /g, '\n')
+    .replace(/\n{3,}/g, '\n\n')
+    .trim();
+
+const PASSWORD_RESET_HTML = wrapEmailBody(`
+            <h2>Password Reset Request</h2>
+            <p>Hi {firstName},</p>
+            <p>We received a request to reset your password for your PawWell Care Center account.</p>
+            <p>Click the button below to reset your password:</p>
+            <div style="text-align: center;">
+                <a href="{link}" class="button">Reset Password</a>
+            </div>
+            <p>Or copy and paste this link into your browser:</p>
+            <p style="word-break: break-all; color: #4A90E2;">{link}</p>
+            <p><strong>Note:</strong> This link will expire in 1 hour.</p>
+            <div class="warning">
+                <p><strong>⚠️ Security Notice:</strong></p>
+                <p>If you didn't request a password reset, please ignore this email and ensure your account is secure.</p>
+            </div>
+`);
+
+const PASSWORD_RESET_TEXT = htmlToText(PASSWORD_RESET_HTML);
+
+const PASSWORD_CHANGED_HTML = wrapEmailBody(`
             <h2>Password Changed Successfully</h2>
-            <p>Hi ${user.firstName},</p>
+            <p>Hi {firstName},</p>
             <div class="success">
                 <p><strong>✅ Your password has been changed successfully!</strong></p>
             </div>
             <p>You can now log in to your PawWell Care Center account using your new password.</p>
             <p>If you didn't make this change, please contact our support team immediately.</p>
-        </div>
-        <div class="footer">
-            <p>&copy; 2025 PawWell Care Center. All rights reserved.</p>
-            <p>Taking care of your pets, one paw at a time.</p>
-        </div>
-    </body>
-    </html>
-  `;
-
-  const textMessage = `
-Password Changed Successfully
-
-Hi ${user.firstName},
-
-✅ Your password has been changed successfully!
-
-You can now log in to your PawWell Care Center account using your new password.
-
-If you didn't make this change, please contact our support team immediately.
+`);
 
-© 2025 PawWell Care Center. All rights reserved.
-  `;
+const PASSWORD_CHANGED_TEXT = htmlToText(PASSWORD_CHANGED_HTML);
 
-  try {
-    await transporter.sendMail({
-      from: config.email.from,
-      to: user.email,
-      subject: 'Password Changed - PawWell Care Center',
-      text: textMessage,
-      html: htmlMessage
-    });
-    return true;
-  } catch (error) {
-    console.error('Error sending password changed email:', error);
-    return false;
-  }
-};
-
-/**
- * Send OTP email
- */
-const sendOTPEmail = async (user, otp) => {
-  const htmlMessage = `
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 600px;
-                margin: 0 auto;
-                padding: 20px;
-            }
-            .header {
-                background-color: #4A90E2;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                border-radius: 5px 5px 0 0;
-            }
-            .content {
-                background-color: #f9f9f9;
-                padding: 30px;
-                border: 1px solid #ddd;
-            }
-            .otp-box {
-                background-color: #ffffff;
-                border: 2px dashed #4A90E2;
-                padding: 20px;
-                text-align: center;
-                margin: 20px 0;
-                border-radius: 8px;
-            }
-            .otp-code {
-                font-size: 32px;
-                font-weight: bold;
-                color: #4A90E2;
-                letter-spacing: 5px;
-                font-family: 'Courier New', monospace;
-            }
-            .footer {
-                text-align: center;
-                padding: 20px;
-                font-size: 12px;
-                color: #666;
-            }
-            .warning {
-                background-color: #fff3cd;
-                padding: 15px;
-                border-left: 4px solid #ffc107;
-                margin: 20px 0;
-            }
-            .info {
-                background-color: #d1ecf1;
-                padding: 15px;
-                border-left: 4px solid #17a2b8;
-                margin: 20px 0;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>🐾 PawWell Care Center</h1>
-        </div>
-        <div class="content">
+const RESET_OTP_HTML = wrapEmailBody(`
             <h2>Password Reset OTP</h2>
-            <p>Hi ${user.firstName},</p>
+            <p>Hi {firstName},</p>
             <p>We received a request to reset your password. Please use the following One-Time Password (OTP) to verify your identity:</p>
-            
+
             <div class="otp-box">
-                <div class="otp-code">${otp}</div>
+                <div class="otp-code">{otp}</div>
                 <p style="margin: 10px 0 0 0; color: #666; font-size: 14px;">Enter this code to proceed with password reset</p>
             </div>
-            
+
             <div class="info">
                 <p><strong>ℹ️ Important Information:</strong></p>
                 <ul style="margin: 5px 0; padding-left: 20px;">
@@ -303,137 +167,29 @@ const sendOTPEmail = async (user, otp) => {
                     <li>Do not share this code with anyone</li>
                 </ul>
             </div>
-            
+
             <div class="warning">
                 <p><strong>⚠️ Security Notice:</strong></p>
                 <p>If you didn't request a password reset, please ignore this email and ensure your account is secure. Your password will not be changed unless the OTP is verified.</p>
             </div>
-        </div>
-        <div class="footer">
-            <p>&copy; 2025 PawWell Care Center. All rights reserved.</p>
-            <p>Taking care of your pets, one paw at a time.</p>
-        </div>
-    </body>
-    </html>
-  `;
-
-  const textMessage = `
-Password Reset OTP
-
-Hi ${user.firstName},
-
-We received a request to reset your password. Please use the following One-Time Password (OTP) to verify your identity:
-
-OTP: ${otp}
+`);
 
-Important Information:
-- This OTP is valid for 10 minutes
-- You have 5 attempts to enter the correct OTP
-- Do not share this code with anyone
-
-⚠️ Security Notice:
-If you didn't request a password reset, please ignore this email and ensure your account is secure.
-
-© 2025 PawWell Care Center. All rights reserved.
-  `;
-
-  try {
-    await transporter.sendMail({
-      from: config.email.from,
-      to: user.email,
-      subject: 'Password Reset OTP - PawWell Care Center',
-      text: textMessage,
-      html: htmlMessage
-    });
-    return true;
-  } catch (error) {
-    console.error('Error sending OTP email:', error);
-    return false;
-  }
-};
+const RESET_OTP_TEXT = htmlToText(RESET_OTP_HTML);
 
-/**
- * Send email verification OTP
- */
-const sendEmailVerificationOTP = async (user, otp) => {
-  const htmlMessage = `
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 600px;
-                margin: 0 auto;
-                padding: 20px;
-            }
-            .header {
-                background-color: #4A90E2;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                border-radius: 5px 5px 0 0;
-            }
-            .content {
-                background-color: #f9f9f9;
-                padding: 30px;
-                border: 1px solid #ddd;
-            }
-            .otp-box {
-                background-color: #ffffff;
-                border: 2px dashed #4A90E2;
-                padding: 20px;
-                text-align: center;
-                margin: 20px 0;
-                border-radius: 8px;
-            }
-            .otp-code {
-                font-size: 32px;
-                font-weight: bold;
-                color: #4A90E2;
-                letter-spacing: 5px;
-                font-family: 'Courier New', monospace;
-            }
-            .footer {
-                text-align: center;
-                padding: 20px;
-                font-size: 12px;
-                color: #666;
-            }
-            .success {
-                background-color: #d4edda;
-                padding: 15px;
-                border-left: 4px solid #28a745;
-                margin: 20px 0;
-            }
-            .info {
-                background-color: #d1ecf1;
-                padding: 15px;
-                border-left: 4px solid #17a2b8;
-                margin: 20px 0;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>🐾 PawWell Care Center</h1>
-        </div>
-        <div class="content">
+const VERIFY_EMAIL_HTML = wrapEmailBody(`
             <div class="success">
                 <p><strong>✅ Welcome to PawWell Care Center!</strong></p>
                 <p>Thank you for registering. Please verify your email to complete your registration.</p>
             </div>
-            
-            <p>Hi ${user.firstName},</p>
+
+            <p>Hi {firstName},</p>
             <p>To complete your registration and activate your account, please use the following One-Time Password (OTP):</p>
-            
+
             <div class="otp-box">
-                <div class="otp-code">${otp}</div>
+                <div class="otp-code">{otp}</div>
                 <p style="margin: 10px 0 0 0; color: #666; font-size: 14px;">Enter this code to verify your email</p>
             </div>
-            
+
             <div class="info">
                 <p><strong>ℹ️ Important Information:</strong></p>
                 <ul style="margin: 5px 0; padding-left: 20px;">
@@ -442,70 +198,237 @@ const sendEmailVerificationOTP = async (user, otp) => {
                     <li>Do not share this code with anyone</li>
                 </ul>
             </div>
-            
-            <p>Once verified, you can log in to your account and start exploring our services for your beloved pets!</p>
-        </div>
-        <div class="footer">
-            <p>&copy; 2025 PawWell Care Center. All rights reserved.</p>
-            <p>Taking care of your pets, one paw at a time.</p>
-        </div>
-    </body>
-    </html>
-  `;
-
-  const textMessage = `
-Welcome to PawWell Care Center!
-
-Hi ${user.firstName},
 
-Thank you for registering. Please verify your email to complete your registration.
-
-To complete your registration and activate your account, please use the following One-Time Password (OTP):
+            <p>Once verified, you can log in to your account and start exploring our services for your beloved pets!</p>
+`);
 
-OTP: ${otp}
+const VERIFY_EMAIL_TEXT = htmlToText(VERIFY_EMAIL_HTML);
 
-Important Information:
-- This OTP is valid for 10 minutes
-- You have 5 attempts to enter the correct OTP
-- Do not share this code with anyone
+/**
+ * Deliver one email, returning true/false instead of throwing.
+ *
+ * Single funnel for the transporter so error handling and the from
+ * address live in one place rather than being repeated per sender.
+ */
+// Failures worth one retry: socket-level flakes the pooled transport can
+// recover from on a fresh connection, and 4xx SMTP "try again later"
+// responses. Permanent rejections (auth, bad recipient) are not retried.
+const TRANSIENT_ERROR_CODES = new Set(['ECONNECTION', 'ECONNRESET', 'ETIMEDOUT', 'EPIPE', 'ESOCKET']);
+const RETRY_DELAY_MS = 500;
+
+const isTransientError = (error) =>
+  TRANSIENT_ERROR_CODES.has(error.code) ||
+  (error.responseCode >= 400 && error.responseCode < 500);
+
+const deliver = async (to, subject, text, html) => {
+  const message = {
+    from: FROM,
+    to,
+    subject,
+    text,
+    html
+  };
 
-Once verified, you can log in to your account and start exploring our services for your beloved pets!
+  try {
+    await transporter.sendMail(message);
+    return true;
+  } catch (error) {
+    if (!isTransientError(error)) {
+      logger.error(`Error sending "${subject}" email:`, error);
+      return false;
+    }
+    logger.warn(`Transient failure sending "${subject}" email, retrying:`, error.message);
+  }
 
-© 2025 PawWell Care Center. All rights reserved.
-  `;
+  await new Promise((resolve) => setTimeout(resolve, RETRY_DELAY_MS));
 
   try {
-    await transporter.sendMail({
-      from: config.email.from,
-      to: user.email,
-      subject: 'Email Verification - PawWell Care Center',
-      text: textMessage,
-      html: htmlMessage
-    });
+    await transporter.sendMail(message);
     return true;
   } catch (error) {
-    console.error('Error sending email verification OTP:', error);
+    logger.error(`Error sending "${subject}" email after retry:`, error);
     return false;
   }
 };
 
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+
+// firstName is the only user-controlled value interpolated into HTML;
+// escape it once per send so a crafted name can't inject markup. Tokens,
+// OTPs and links are server-generated and need no escaping.
+const escapeHtml = (value) =>
+  String(value ?? '').replace(HTML_ESCAPE_RE, (ch) => HTML_ESCAPES[ch]);
+
+// Resolved once; only the token varies per send
+const RESET_LINK_PREFIX = `${config.frontendUrl}/reset-password?token=`;
+
+// Sender address never changes at runtime; bind it once
+const FROM = config.email.from;
+
+// Registry of the templated mails: one subject/body entry per kind, so
+// rendering and delivery live in a single dispatch path instead of four
+// structurally identical functions.
+const TEMPLATES = {
+  passwordReset: {
+    subject: 'Password Reset - PawWell Care Center',
+    html: PASSWORD_RESET_HTML,
+    text: PASSWORD_RESET_TEXT
+  },
+  passwordChanged: {
+    subject: 'Password Changed - PawWell Care Center',
+    html: PASSWORD_CHANGED_HTML,
+    text: PASSWORD_CHANGED_TEXT
+  },
+  resetOtp: {
+    subject: 'Password Reset OTP - PawWell Care Center',
+    html: RESET_OTP_HTML,
+    text: RESET_OTP_TEXT
+  },
+  verifyEmail: {
+    subject: 'Email Verification - PawWell Care Center',
+    html: VERIFY_EMAIL_HTML,
+    text: VERIFY_EMAIL_TEXT
+  }
+};
+
+/**
+ * Render and deliver one of the registered templated mails.
+ *
+ * context carries the template-specific values (link, otp); firstName is
+ * filled in from the user, HTML-escaped for the HTML variant.
+ */
+const sendTemplated = (kind, user, context = {}) => {
+  const { subject, html, text } = TEMPLATES[kind];
+  const textContext = { firstName: user.firstName, ...context };
+  const htmlContext = { ...textContext, firstName: escapeHtml(user.firstName) };
+
+  return deliver(
+    user.email,
+    subject,
+    renderTemplate(text, textContext),
+    renderTemplate(html, htmlContext)
+  );
+};
+
+/**
+ * Send password reset email
+ */
+const sendPasswordResetEmail = async (user, token) =>
+  sendTemplated('passwordReset', user, { link: RESET_LINK_PREFIX + token });
+
+// Rendered-body memo for the password-changed mail, whose only variable
+// is the first name — many users share one, so repeat sends become a Map
+// lookup. Token/OTP-bearing templates are never cached since their bodies
+// are unique per send. Bounded with oldest-first eviction.
+const RENDER_CACHE_MAX_ENTRIES = 500;
+const passwordChangedCache = new Map();
+
+const renderPasswordChanged = (firstName) => {
+  let rendered = passwordChangedCache.get(firstName);
+  if (!rendered) {
+    rendered = {
+      text: renderTemplate(TEMPLATES.passwordChanged.text, { firstName }),
+      html: renderTemplate(TEMPLATES.passwordChanged.html, { firstName: escapeHtml(firstName) })
+    };
+    if (passwordChangedCache.size >= RENDER_CACHE_MAX_ENTRIES) {
+      passwordChangedCache.delete(passwordChangedCache.keys().next().value);
+    }
+    passwordChangedCache.set(firstName, rendered);
+  }
+  return rendered;
+};
+
+/**
+ * Send password changed confirmation email
+ */
+const sendPasswordChangedEmail = async (user) => {
+  const { text, html } = renderPasswordChanged(user.firstName);
+  return deliver(user.email, TEMPLATES.passwordChanged.subject, text, html);
+};
+
+/**
+ * Send OTP email
+ */
+const sendOTPEmail = async (user, otp) => sendTemplated('resetOtp', user, { otp });
+
+/**
+ * Send email verification OTP
+ */
+const sendEmailVerificationOTP = async (user, otp) =>
+  sendTemplated('verifyEmail', user, { otp });
+
 /**
  * Send a generic email
  */
 const sendEmail = async ({ to, subject, text, html }) => {
+    return deliver(to, subject, text, html);
+};
+
+/**
+ * Send a batch of emails over the pooled transporter in one go.
+ *
+ * Each message is { to, subject, text, html }. All sends are dispatched
+ * together so the pool can fan them out over its open SMTP sessions
+ * instead of one full conversation per message. Returns
+ * { sent, failed } counts; individual failures are logged, not thrown.
+ */
+const sendEmailBatch = async (messages) => {
+  const results = await Promise.allSettled(
+    messages.map((message) =>
+      transporter.sendMail({ from: FROM, ...message })
+    )
+  );
+
+  let sent = 0;
+  let failed = 0;
+  results.forEach((result, i) => {
+    if (result.status === 'fulfilled') {
+      sent += 1;
+    } else {
+      failed += 1;
+      logger.error(`Error sending batched email to ${messages[i].to}:`, result.reason);
+    }
+  });
+
+  return { sent, failed };
+};
+
+// Recipients per SMTP message for broadcast mail; one DATA payload
+// covers the whole batch instead of one full send per address
+const ANNOUNCEMENT_BCC_BATCH_SIZE = 50;
+
+/**
+ * Send one identical announcement to many recipients via BCC batches.
+ *
+ * recipients is a list of email addresses; the body is shared, so each
+ * batch of 50 goes out as a single message with the recipients in BCC
+ * (addresses stay hidden from each other). Returns { sent, failed }
+ * recipient counts; a failed batch is logged and the rest continue.
+ */
+const sendAnnouncement = async (recipients, subject, text, html) => {
+  let sent = 0;
+  let failed = 0;
+
+  for (let i = 0; i < recipients.length; i += ANNOUNCEMENT_BCC_BATCH_SIZE) {
+    const batch = recipients.slice(i, i + ANNOUNCEMENT_BCC_BATCH_SIZE);
     try {
-        await transporter.sendMail({
-            from: config.email.from,
-            to,
-            subject,
-            text,
-            html
-        });
-        return true;
+      await transporter.sendMail({
+        from: FROM,
+        to: FROM,
+        bcc: batch,
+        subject,
+        text,
+        html
+      });
+      sent += batch.length;
     } catch (error) {
-        console.error('Error sending email:', error);
-        return false;
+      failed += batch.length;
+      logger.error(`Error sending announcement batch (${batch.length} recipients):`, error);
     }
+  }
+
+  return { sent, failed };
 };
 
 module.exports = {
@@ -513,5 +436,7 @@ module.exports = {
   sendPasswordChangedEmail,
     sendOTPEmail,
     sendEmailVerificationOTP,
-    sendEmail
+    sendEmail,
+    sendEmailBatch,
+    sendAnnouncement
 };
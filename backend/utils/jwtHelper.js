@@ -1,26 +1,26 @@
 const jwt = require('jsonwebtoken');
+const crypto = require('crypto');
 const config = require('../config/config');
 
+// Signing inputs are fixed for the process lifetime; resolving them once
+// also spares jsonwebtoken re-validating the options object per sign
+const JWT_SECRET = config.jwt.secret;
+const ACCESS_SIGN_OPTIONS = { expiresIn: config.jwt.accessTokenExpire };
+const REFRESH_SIGN_OPTIONS = { expiresIn: config.jwt.refreshTokenExpire };
+
 /**
- * Generate JWT access token
+ * Generate JWT access token. The jti lets logout revoke this specific
+ * token via the deny list before it expires.
  */
 const generateAccessToken = (userId) => {
-  return jwt.sign(
-    { userId, type: 'access' },
-    config.jwt.secret,
-    { expiresIn: config.jwt.accessTokenExpire }
-  );
+  return jwt.sign({ userId, type: 'access', jti: crypto.randomUUID() }, JWT_SECRET, ACCESS_SIGN_OPTIONS);
 };
 
 /**
  * Generate JWT refresh token
  */
 const generateRefreshToken = (userId) => {
-  return jwt.sign(
-    { userId, type: 'refresh' },
-    config.jwt.secret,
-    { expiresIn: config.jwt.refreshTokenExpire }
-  );
+  return jwt.sign({ userId, type: 'refresh', jti: crypto.randomUUID() }, JWT_SECRET, REFRESH_SIGN_OPTIONS);
 };
 
 /**
@@ -38,7 +38,7 @@ const generateTokens = (userId) => {
  */
 const verifyToken = (token) => {
   try {
-    return jwt.verify(token, config.jwt.secret);
+    return jwt.verify(token, JWT_SECRET);
   } catch (error) {
     return null;
   }
@@ -0,0 +1,27 @@
+/**
+ * Minimal leveled logger.
+ *
+ * Thin wrapper over console so call sites can be filtered by severity
+ * (LOG_LEVEL env var: error | warn | info | debug, default info)
+ * without pulling in a logging dependency. Messages below the configured
+ * level are dropped before any formatting work happens.
+ */
+
+const LEVELS = { error: 0, warn: 1, info: 2, debug: 3 };
+
+const configuredLevel = LEVELS[(process.env.LOG_LEVEL || 'info').toLowerCase()] ?? LEVELS.info;
+
+const log = (level, consoleMethod, args) => {
+  if (LEVELS[level] <= configuredLevel) {
+    consoleMethod(`[${level}]`, ...args);
+  }
+};
+
+const logger = {
+  error: (...args) => log('error', console.error, args),
+  warn: (...args) => log('warn', console.warn, args),
+  info: (...args) => log('info', console.log, args),
+  debug: (...args) => log('debug', console.log, args)
+};
+
+module.exports = logger;
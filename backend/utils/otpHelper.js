@@ -3,9 +3,12 @@ const bcrypt = require('bcrypt');
 
 /**
  * Generate a random 6-digit OTP
+ *
+ * crypto.randomInt draws from the CSPRNG without the modulo bias (or
+ * predictability) of Math.random, and skips the float math entirely.
  */
 const generateOTP = () => {
-  return Math.floor(100000 + Math.random() * 900000).toString();
+  return crypto.randomInt(100000, 1000000).toString();
 };
 
 /**
@@ -0,0 +1,63 @@
+/**
+ * In-process deny list for revoked JWT IDs (jti).
+ *
+ * Tokens are stateless, so logout alone can't stop a copied cookie from
+ * being replayed until it expires. Logout records the jti of both cookie
+ * tokens here and the auth middleware rejects any denied jti. Entries are
+ * kept only until the token's own expiry — after that the signature check
+ * rejects it anyway — and a periodic sweep drops expired entries so the
+ * Map stays bounded by the number of logouts inside one token lifetime.
+ *
+ * Like userCache, this is per-process state: a multi-instance deployment
+ * would need to move it to a shared store.
+ */
+
+const SWEEP_INTERVAL_MS = 10 * 60 * 1000;
+
+const denied = new Map(); // jti -> expiry timestamp (ms)
+
+/**
+ * Mark a token's jti as revoked until `expMs` (milliseconds since epoch).
+ */
+const denyToken = (jti, expMs) => {
+  if (jti && expMs > Date.now()) {
+    denied.set(jti, expMs);
+  }
+};
+
+/**
+ * True if this jti has been revoked and the token hasn't expired yet.
+ */
+const isTokenDenied = (jti) => {
+  if (!jti) {
+    // Tokens issued before jti was added carry no ID; they can't be
+    // individually revoked and age out at their normal expiry
+    return false;
+  }
+  const expMs = denied.get(jti);
+  if (expMs === undefined) {
+    return false;
+  }
+  if (expMs <= Date.now()) {
+    denied.delete(jti);
+    return false;
+  }
+  return true;
+};
+
+const sweep = () => {
+  const now = Date.now();
+  for (const [jti, expMs] of denied) {
+    if (expMs <= now) {
+      denied.delete(jti);
+    }
+  }
+};
+
+// unref() so the sweep timer never keeps the process alive on shutdown
+setInterval(sweep, SWEEP_INTERVAL_MS).unref();
+
+module.exports = {
+  denyToken,
+  isTokenDenied
+};
@@ -0,0 +1,76 @@
+/**
+ * In-process cache for authenticated user lookups.
+ *
+ * The auth middleware fetches the User row by primary key on every
+ * authenticated request, and those rows change rarely compared to how
+ * often they are read. A short-TTL cache turns most of those SELECTs into
+ * a Map lookup. The TTL is deliberately short so admin-side changes
+ * (deactivation, role change) still take effect within seconds even if an
+ * invalidation is missed; any code path that writes a user row should
+ * still call invalidateUser(id) for immediate effect.
+ */
+
+const USER_CACHE_TTL_MS = parseInt(process.env.USER_CACHE_TTL_MS) || 30 * 1000;
+const USER_CACHE_MAX_ENTRIES = 1000;
+
+const cache = new Map(); // userId -> { user, expiresAt }
+
+/**
+ * Return the cached user for `userId`, or load it via `loader(userId)` and
+ * cache the result. Misses (null users) are not cached.
+ */
+const getCachedUser = async (userId, loader) => {
+  const entry = cache.get(userId);
+  if (entry && entry.expiresAt > Date.now()) {
+    return entry.user;
+  }
+
+  const user = await loader(userId);
+
+  if (user) {
+    if (cache.size >= USER_CACHE_MAX_ENTRIES) {
+      // Map iterates in insertion order, so this evicts the oldest entry
+      cache.delete(cache.keys().next().value);
+    }
+    cache.set(userId, { user, expiresAt: Date.now() + USER_CACHE_TTL_MS });
+  } else {
+    cache.delete(userId);
+  }
+
+  return user;
+};
+
+/**
+ * Drop a user from the cache. Call after any write to their row.
+ */
+const invalidateUser = (userId) => {
+  cache.delete(userId);
+};
+
+// Serialized profile payloads, keyed on the model instance itself. While a
+// user instance sits in the cache above, repeat profile reads reuse the
+// same plain object instead of re-running toJSON() per request. Keying on
+// the instance makes invalidation automatic: invalidateUser() drops the
+// instance, the next request loads a fresh one, and the WeakMap lets the
+// stale entry be garbage-collected with it.
+const profileJsonCache = new WeakMap(); // User instance -> serialized profile
+
+/**
+ * Return the cached serialized profile for `user`, or build it via
+ * `build(user)` and cache it. Callers share the returned object, so treat
+ * it as read-only after `build` runs.
+ */
+const getCachedProfileJSON = (user, build) => {
+  let json = profileJsonCache.get(user);
+  if (!json) {
+    json = build(user);
+    profileJsonCache.set(user, json);
+  }
+  return json;
+};
+
+module.exports = {
+  getCachedUser,
+  getCachedProfileJSON,
+  invalidateUser
+};
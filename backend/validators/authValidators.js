@@ -1,32 +1,50 @@
 const { body, param } = require('express-validator');
-const { User } = require('../models');
+
+/**
+ * Shared password strength rule for registration and password reset.
+ * Checks "contains a letter" and "contains a digit" in a single pass over
+ * the value instead of running two separate regex scans per request.
+ */
+const passwordStrengthValidation = (field) =>
+  body(field)
+    .isLength({ min: 8 })
+    .withMessage('Password must be at least 8 characters long.')
+    .custom((value) => {
+      let hasLetter = false;
+      let hasDigit = false;
+      for (let i = 0; i < value.length && !(hasLetter && hasDigit); i++) {
+        const code = value.charCodeAt(i);
+        if (code >= 48 && code <= 57) {
+          hasDigit = true;
+        } else if ((code >= 65 && code <= 90) || (code >= 97 && code <= 122)) {
+          hasLetter = true;
+        }
+      }
+      if (!hasLetter) {
+        throw new Error('Password must contain at least one letter.');
+      }
+      if (!hasDigit) {
+        throw new Error('Password must contain at least one number.');
+      }
+      return true;
+    });
 
 /**
  * Validation rules for user registration
  */
 const registerValidation = [
+  // Email uniqueness is NOT checked here: the register controller already
+  // looks the user up (with paranoid: false, to support reactivating
+  // soft-deleted accounts) and the users table has a unique constraint as
+  // the final guard. A second SELECT per registration attempt is redundant.
   body('email')
     .trim()
     .isEmail()
     .withMessage('Enter a valid email address.')
-    .normalizeEmail()
-    .custom(async (value) => {
-      const existingUser = await User.findOne({ where: { email: value.toLowerCase() } });
-      // Allow registration if user doesn't exist OR if user exists but is inactive (soft-deleted)
-      if (existingUser && existingUser.isActive) {
-        throw new Error('A user with this email already exists.');
-      }
-      return true;
-    }),
-  
-  body('password')
-    .isLength({ min: 8 })
-    .withMessage('Password must be at least 8 characters long.')
-    .matches(/[A-Za-z]/)
-    .withMessage('Password must contain at least one letter.')
-    .matches(/\d/)
-    .withMessage('Password must contain at least one number.'),
+    .normalizeEmail(),
   
+  passwordStrengthValidation('password'),
+
   body('confirmPassword')
     .custom((value, { req }) => {
       if (value !== req.body.password) {
@@ -42,14 +60,8 @@ const registerValidation = [
     .isLength({ min: 2 })
     .withMessage('Full name must be at least 2 characters long.')
     .matches(/^[A-Za-z\s]+$/)
-    .withMessage('Full name should contain only letters (A–Z).')
-    .custom((value) => {
-      if (/\d/.test(value)) {
-        throw new Error('Full name should contain only letters (A–Z).');
-      }
-      return true;
-    }),
-  
+    .withMessage('Full name should contain only letters (A–Z).'),
+
   body('lastName')
     .trim()
     .notEmpty()
@@ -57,14 +69,17 @@ const registerValidation = [
     .isLength({ min: 2 })
     .withMessage('Last name must be at least 2 characters long.')
     .matches(/^[A-Za-z\s]+$/)
-    .withMessage('Last name should contain only letters (A–Z).')
-    .custom((value) => {
-      if (/\d/.test(value)) {
-        throw new Error('Last name should contain only letters (A–Z).');
-      }
-      return true;
-    }),
-  
+    .withMessage('Last name should contain only letters (A–Z).'),
+
+  // Strip whitespace before checking so "98 1234 5678" style input passes;
+  // the sanitized value is what gets stored, which keeps it compatible with
+  // the users.phone_number 10-digit validation at account creation
+  body('phoneNumber')
+    .optional({ checkFalsy: true })
+    .customSanitizer((value) => String(value).replace(/\s+/g, ''))
+    .matches(/^\d{10}$/)
+    .withMessage('Phone number must be exactly 10 digits.'),
+
   body('userType')
     .optional()
     .isIn(['pet_owner', 'admin', 'staff'])
@@ -123,16 +138,11 @@ const resetPasswordValidation = [
   body('token')
     .notEmpty()
     .withMessage('Reset token is required.')
-    .isUUID()
+    // base64url tokens (43 chars) plus legacy UUID tokens (36 chars)
+    .matches(/^[A-Za-z0-9_-]{22,64}$/)
     .withMessage('Invalid reset token format.'),
   
-  body('newPassword')
-    .isLength({ min: 8 })
-    .withMessage('Password must be at least 8 characters long.')
-    .matches(/[A-Za-z]/)
-    .withMessage('Password must contain at least one letter.')
-    .matches(/\d/)
-    .withMessage('Password must contain at least one number.'),
+  passwordStrengthValidation('newPassword'),
   
   body('confirmPassword')
     .custom((value, { req }) => {